@@ -16,13 +16,19 @@ class SFVectorLayer(sf.Reader, pyromb.VectorLayer):
     """
     def __init__(self, path) -> None:
         super().__init__(path)
+        self._fieldNames = tuple(f[0] for f in self.fields if f[0] != 'DeletionFlag')
 
     def geometry(self, i) -> list:
         return self.shape(i).points
     
     def record(self, i) -> dict:
-        return super().record(i)
+        return dict(zip(self._fieldNames, super().record(i)))
     
+    def features(self):
+        # Stream shapes and records together in a single forward pass
+        for sr in self.iterShapeRecords():
+            yield sr.shape.points, dict(zip(self._fieldNames, sr.record))
+
     def __len__(self) -> int:
         return super().__len__()
 
@@ -51,9 +57,9 @@ def main():
     traveller = pyromb.Traveller(catchment)
     
     ### Write ###
-    # Control vector to file with a call to the Traveller's getVector method
+    # Control vector to file with a call to the Traveller's writeVector method
     with open(os.path.join(DIR, '../vector.catg' if isinstance(model, pyromb.RORB) else '../runfile.wbn'), 'w') as f:
-        f.write(traveller.getVector(model))
+        traveller.writeVector(model, f)
     
     ### Plot the catchment ###.
     if plot: plot_catchment(connected, tr, tc, tb)
@@ -17,6 +17,8 @@ class Basin(Node):
         Fraction of the basin that is impervious [0,1]
     """
 
+    __slots__ = ("_area", "_fi")
+
     def __init__(self, 
                  name: str = "", 
                  x: float = 0, 
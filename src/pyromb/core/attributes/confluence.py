@@ -15,6 +15,8 @@ class Confluence(Node):
         True if this confluence is the outfall of the model. 
     """
 
+    __slots__ = ("_isOut",)
+
     def __init__(self, name: str = "", x: float = 0, y: float = 0, out: bool = False) -> None:
         super().__init__(name, x, y)
         self._isOut: bool = out
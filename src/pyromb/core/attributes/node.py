@@ -12,6 +12,8 @@ class Node(Point):
         The name of the node
     """
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str = "", x: float = 0.0, y: float = 0.0) -> None:
         super().__init__(x, y)
         self._name: str = name
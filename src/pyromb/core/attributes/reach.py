@@ -20,6 +20,8 @@ class Reach(Line):
         The slope of the reach in m/m
     """
 
+    __slots__ = ("_name", "_type", "_slope", "_idx")
+
     def __init__(self, name: str = "", 
                  vector: list = [], 
                  type: ReachType = ReachType.NATURAL, 
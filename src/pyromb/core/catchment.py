@@ -3,8 +3,12 @@ from .attributes.confluence import Confluence
 from .attributes.node import Node
 from .attributes.reach import Reach
 from ..math import geometry
+import math
 import numpy as np
 
+# Width of the grid cells used to snap reach ends to nodes, as a fraction of the mean node spacing
+_GRID_CELL_FRACTION = 0.25
+
 class Catchment:
     """The Catchment is a tree of attributes which describes how water 
     flows through the model and the entities which act upon it. 
@@ -26,6 +30,9 @@ class Catchment:
         self._incidenceMatrixUS: list = []
         self._out = 0
         self._endSentinel = -1
+        self._vertexCoords = np.empty((0, 2))
+        self._vertexGrid: dict = {}
+        self._gridWidth = 1.0
 
     def connect(self) -> tuple:
         """Connect the individual attributes to create the catchment. 
@@ -36,26 +43,28 @@ class Catchment:
             (downstream, upstream) incidence matricies of the catchment tree.
         """
         
-        connectionMatrix = np.zeros((len(self._vertices), len(self._edges)), dtype=int)
-        for i, edge in enumerate(self._edges):
-            s = edge.getStart()
-            e = edge.getEnd()
-            minStart = 999
-            minEnd = 999
-            closestStart = 0
-            closestEnd = 0
-            for j, vert in enumerate(self._vertices):
-                tempStart = geometry.length([vert, s])
-                tempEnd = geometry.length([vert, e])
-                if tempStart < minStart:
-                    closestStart = j
-                    minStart = tempStart
-                if tempEnd < minEnd:
-                    closestEnd = j
-                    minEnd = tempEnd
-            connectionMatrix[closestStart][i] = 1
-            connectionMatrix[closestEnd][i] = 2   
+        vertexPoints = [v.coordinates() for v in self._vertices]
+        self._vertexCoords = np.array(vertexPoints, dtype=np.float64).reshape(-1, 2)
+        self._gridWidth = _gridCellWidth(self._vertexCoords)
+        self._vertexGrid = {}
+        for k, p in enumerate(vertexPoints):
+            self._vertexGrid.setdefault(_gridCell(*p, self._gridWidth), []).append(k)
+
+        # Start and end of every reach, interleaved, resolved in one batch
+        endpoints = [p for e in self._edges for p in (e.getStart().coordinates(), e.getEnd().coordinates())]
+        endpointIdx = self._closestVertices(endpoints)
+        startIdx = endpointIdx[0::2]
+        endIdx = endpointIdx[1::2]
 
+        # Edges incident to each vertex in compressed sparse row form
+        # The edges of vertex m are incident[offsets[m]:offsets[m + 1]]
+        edgeIdx = np.arange(len(self._edges), dtype=np.int64)
+        keep = startIdx != endIdx
+        m = np.concatenate((startIdx, endIdx[keep]))
+        n = np.concatenate((edgeIdx, edgeIdx[keep]))
+        incident = n[np.lexsort((n, m))]
+        offsets = np.zeros(len(self._vertices) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(m, minlength=len(self._vertices)), out=offsets[1:])
         
         # Find the 'out' node
         # Used to determine the starting point of breath first search
@@ -74,41 +83,161 @@ class Catchment:
         # value of m n =  the index of the downstream node
         # Think about I as relating upstream nodes (m) to downstream nodes (m n) through reach (n) 
         # (m n) of -1 indicates no downstream node for relationship m n
-        newIncidenceDS = np.zeros((len(self._vertices), len(self._edges)), dtype=int)
+        newIncidenceDS = np.zeros((len(self._vertices), len(self._edges)), dtype=np.int32)
         newIncidenceDS.fill(self._endSentinel)
         newIncidenceUS = newIncidenceDS.copy()
-        queue = []
-        colour = np.zeros((len(self._vertices), len(self._edges)))
-        i = self._out
-        j = 0
-        queue.append((i, j))
-        while(len(queue) != 0):
-            #Move in the n direction
-            u = queue.pop()
-            idxi = u[0]
-            j = u[1]
-            for k in range(len(connectionMatrix[u[0]])):
-                idxj = j % len(connectionMatrix[idxi])
-                if connectionMatrix[idxi][idxj] > 0:
-                    if colour[idxi][idxj] == 0:
-                        colour[idxi][idxj] = 1
-                        u = (idxi, idxj)
-                        queue.append(u)
-                j += 1
+        if len(self._vertices):
+            _orientReaches(offsets, incident, startIdx, endIdx, self._out, newIncidenceDS, newIncidenceUS)
+        self._incidenceMatrixDS = newIncidenceDS
+        self._incidenceMatrixUS = newIncidenceUS
+        
+        return (self._incidenceMatrixDS, self._incidenceMatrixUS)
+
+    def _closestVertices(self, points: list) -> np.ndarray:
+        """The index of the vertex closest to each of the points.
+
+        Points within one grid cell width of a vertex are resolved from the 
+        vertex grid. Only the remaining points are searched for.
+
+        Parameters
+        ----------
+        points : list
+            The (x, y) co-ordinate tuples to find the closest vertex to.
+
+        Returns
+        -------
+        np.ndarray
+            (n,) array of the index of the closest vertex to each point.
+        """
+
+        idx = np.array([self._gridVertex(x, y) for x, y in points], dtype=np.int64)
+        missing = np.flatnonzero(idx < 0)
+        if len(missing):
+            coords = np.array([points[i] for i in missing], dtype=np.float64)
+            idx[missing] = self._nearestVertices(coords)
+        return idx
+
+    def _gridVertex(self, x: float, y: float) -> int:
+        """The index of the vertex closest to a point from the vertex grid.
+
+        Searches the cell containing the point and its eight neighbours, which
+        hold every vertex within one cell width of the point. A vertex found
+        within that distance is therefore the closest vertex overall.
+
+        Parameters
+        ----------
+        x : float
+            The x co-ordinate of the point.
+        y : float
+            The y co-ordinate of the point.
+
+        Returns
+        -------
+        int
+            The index of the closest vertex, -1 if none is closer than one cell width.
+        """
+
+        cx, cy = _gridCell(x, y, self._gridWidth)
+        best = (self._gridWidth * self._gridWidth, -1)
+        for i in (cx - 1, cx, cx + 1):
+            for j in (cy - 1, cy, cy + 1):
+                for k in self._vertexGrid.get((i, j), ()):
+                    vx, vy = self._vertices[k].coordinates()
+                    best = min(best, ((vx - x) ** 2 + (vy - y) ** 2, k))
+        return best[1]
+
+    def _nearestVertices(self, points: np.ndarray) -> np.ndarray:
+        """The index of the vertex nearest to each of the points.
+
+        Searches the cached vertex co-ordinates for all the points at once.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            (n, 2) array of the x, y co-ordinates to find the closest vertex to.
+
+        Returns
+        -------
+        np.ndarray
+            (n,) array of the index of the closest vertex to each point.
+        """
+
+        return geometry.nearest(self._vertexCoords, points)[0]
+
+
+def _gridCell(x: float, y: float, width: float) -> tuple:
+    return (math.floor(x / width), math.floor(y / width))
+
+def _gridCellWidth(coords: np.ndarray) -> float:
+    """The width of the vertex grid cells for the (n, 2) vertex co-ordinates.
+
+    Scaled to the mean spacing of the vertices over their extent, so a cell 
+    holds about one vertex in any co-ordinate units, projected or geographic.
+    """
+
+    if len(coords) < 2:
+        return 1.0
+    w, h = coords.max(axis=0) - coords.min(axis=0)
+    spacing = math.sqrt(w * h / len(coords)) if w * h > 0 else max(w, h) / len(coords)
+    return _GRID_CELL_FRACTION * spacing if spacing > 0 else 1.0
+
+def _orientReaches(offsets: np.ndarray, 
+                   incident: np.ndarray, 
+                   startIdx: np.ndarray, 
+                   endIdx: np.ndarray, 
+                   out: int, 
+                   incidenceDS: np.ndarray, 
+                   incidenceUS: np.ndarray) -> None:
+    """Search the catchment from the out node, filling the incidence matrices.
+
+    Each reach is crossed once, from its downstream node to its upstream node,
+    visiting nodes breadth first. The search runs over plain lists and the 
+    matrices are filled in one assignment each once it is done.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        (m + 1,) offsets into incident of each node's reaches.
+    incident : np.ndarray
+        The reaches incident to each node, grouped by node.
+    startIdx : np.ndarray
+        (n,) index of the node at the start of each reach.
+    endIdx : np.ndarray
+        (n,) index of the node at the end of each reach.
+    out : int
+        Index of the out node.
+    incidenceDS : np.ndarray
+        (m, n) downstream incidence matrix, filled in place.
+    incidenceUS : np.ndarray
+        (m, n) upstream incidence matrix, filled in place.
+    """
+
+    offsets = offsets.tolist()
+    incident = incident.tolist()
+    start = startIdx.tolist()
+    end = endIdx.tolist()
+    visited = [False] * len(start)
+    downstream = []
+    upstream = []
+    reaches = []
+    queue = [out]
+    head = 0
+    while head < len(queue):
+        #Move in the n direction
+        i = queue[head]
+        head += 1
+        for p in range(offsets[i], offsets[i + 1]):
+            j = incident[p]
+            if visited[j]:
+                continue
+            visited[j] = True
 
             #Move in the m direction
-            i = u[0]
-            idxj = u[1]
-            for l in range(len(connectionMatrix)):
-                idxi = i % len(connectionMatrix)
-                if connectionMatrix[idxi][idxj] > 0:
-                    if colour[idxi][idxj] == 0:
-                        colour[idxi][idxj] = 1
-                        queue.append((idxi, idxj))
-                        newIncidenceUS[u[0]][u[1]] = idxi
-                        newIncidenceDS[idxi][idxj] = u[0]
-                i += 1
-        self._incidenceMatrixDS = newIncidenceDS.copy()
-        self._incidenceMatrixUS = newIncidenceUS.copy()
-        
-        return (self._incidenceMatrixDS, self._incidenceMatrixUS)
\ No newline at end of file
+            k = end[j] if start[j] == i else start[j]
+            if k != i:
+                queue.append(k)
+                downstream.append(i)
+                upstream.append(k)
+                reaches.append(j)
+    incidenceUS[downstream, reaches] = upstream
+    incidenceDS[upstream, reaches] = downstream
@@ -1,3 +1,4 @@
+import numpy as np
 from .point import Point
 from ...math import geometry
 
@@ -14,23 +15,16 @@ class Line():
         The points that make the line.
     """
 
+    __slots__ = ("_vector", "_end", "_length")
+
     def __init__(self, vector:list = []):
         super().__init__()
         self._vector = pointVector(vector)
         self._end = len(self._vector) - 1
-        self._length = geometry.length(self.toVector())
+        self._length = geometry.length(self._vector)
 
     def __iter__(self):
-        self.n = 0
-        return self
-    
-    def __next__(self) -> Point:
-        if self.n <= self._end:
-            point = self._vector[self.n]
-            self.n += 1
-            return point
-        else:
-            raise StopIteration
+        return iter(self._vector)
     
     def __len__(self):
         return self._end
@@ -39,7 +33,11 @@ class Line():
         return self._vector[i]
     
     def __setitem__(self, i, v:Point):
+        if isinstance(i, slice):
+            v = pointVector(v)
         self._vector[i] = v
+        self._end = len(self._vector) - 1
+        self._length = geometry.length(self._vector)
     
     def append(self, point:Point):
         """Add an additional point to the line.
@@ -52,9 +50,10 @@ class Line():
             The point to add to the line.
         """
         
+        if self._vector:
+            self._length += geometry.segment_length(self._vector[-1], point)
         self._vector.append(point)
         self._end += 1
-        self._length = geometry.length(self.toVector())
     
     def length(self) -> float:
         """The cartisian length of the line.
@@ -78,6 +77,19 @@ class Line():
 
         return self._vector
 
+    def toArray(self) -> np.ndarray:
+        """Convert the line into an array of co-ordinates.
+
+        Returns
+        -------
+        np.ndarray
+            (n, 2) array of the x, y co-ordinates of the points.
+        """
+
+        n = len(self._vector)
+        coords = (c for p in self._vector for c in p.coordinates())
+        return np.fromiter(coords, dtype=np.float64, count=2 * n).reshape(n, 2)
+
     def getStart(self) -> Point:
         """Get the starting point of the line.
 
@@ -103,10 +115,15 @@ class Line():
 def pointVector(vector:list) -> list:
     """Convert a list of x,y co-ordinates into a list of Points
 
+    A list which already holds Points is copied as is. Only the first 
+    element is checked, the list is assumed to be homogeneous. An (n, 2) 
+    array is converted to floats in one pass before the Points are built.
+
     Parameters
     ----------
-    vector : list
-        A list of (x,y) co-ordinate tuple as floats.
+    vector : list | np.ndarray
+        A list of (x,y) co-ordinate tuple as floats, a list of Points or an 
+        (n, 2) array of co-ordinates.
 
     Returns
     -------
@@ -114,7 +131,8 @@ def pointVector(vector:list) -> list:
         A list of (x,y) co-odinate tuple as points.
     """
 
-    points = []
-    for t in vector:
-        points.append(Point(t[0], t[1]))
-    return points
\ No newline at end of file
+    if isinstance(vector, list) and vector and isinstance(vector[0], Point):
+        return list(vector)
+    if isinstance(vector, np.ndarray):
+        vector = vector.tolist()
+    return [Point(t[0], t[1]) for t in vector]
\ No newline at end of file
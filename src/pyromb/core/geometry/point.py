@@ -9,9 +9,12 @@ class Point:
         The y co-ordinate
     """
 
+    __slots__ = ("_x", "_y", "_coords")
+
     def __init__(self, x: float = 0.0, y: float = 0.0):
         self._x = x
         self._y = y
+        self._coords = (x, y)
     
     def __str__(self):
         return "[{}, {}]".format(self._x, self._y)
@@ -25,4 +28,4 @@ class Point:
             (x,y) co-ordinates.
         """
         
-        return (self._x, self._y) 
+        return self._coords
@@ -1,5 +1,6 @@
+import numpy as np
 from .line import Line
-from math import geometry
+from ...math import geometry
 from .point import Point
 
 class Polygon(Line):
@@ -20,11 +21,16 @@ class Polygon(Line):
         The points which form the polygon
     """
     
+    __slots__ = ("_area", "_centroid")
+
     def __init__(self, vector:list = []):
         super().__init__(vector)
-        self.append(self[0])
-        self._area = geometry.polygon_area(self.toVector())
-        self._centroid = geometry.polygon_centroid(self.toVector())
+        coords = self.toArray()
+        if not np.array_equal(coords[0], coords[-1]):
+            self.append(self[0])
+            coords = np.vstack((coords, coords[:1]))
+        self._area = geometry.polygon_area(coords)
+        self._centroid = geometry.polygon_centroid(coords)
     
     @property
     def area(self) -> float:
@@ -3,9 +3,12 @@ from ..attributes.confluence import Confluence
 from ..attributes.reach import Reach
 from ..attributes.reach import ReachType
 from ..geometry.line import pointVector
-from ..geometry.point import Point
 from ..gis.vector_layer import VectorLayer
 from ...math import geometry
+import numpy as np
+
+# ReachType members by value, saves the Enum lookup for every reach
+_REACH_TYPES = {t.value: t for t in ReachType}
 
 class Builder():
     """
@@ -32,12 +35,8 @@ class Builder():
             A list of the reache objects.
         """
 
-        reaches = []
-        for i in range(len(reach)):
-            s = reach.geometry(i)
-            r = reach.record(i)
-            reaches.append(Reach(r['id'], s, ReachType(r['t']), r['s']))    
-        return reaches
+        types = _REACH_TYPES.get
+        return [Reach(r['id'], s, types(r['t']) or ReachType(r['t']), r['s']) for s, r in reach.features()]
 
     def basin(self, centroid: VectorLayer, basin: VectorLayer) -> list:
         """Build the basin objects.
@@ -55,21 +54,15 @@ class Builder():
             A list of the basin objects.
         """
         basins = []
-        for i in range(len(centroid)):
-            min = 0
-            d = 999
-            s = centroid.geometry(i)
-            r = centroid.record(i)
+        polygons = [pointVector(b) for b, _ in basin.features()]
+        centres = np.fromiter((c for v in polygons for c in geometry.polygon_centroid(v).coordinates()), dtype=np.float64, count=2 * len(polygons)).reshape(-1, 2)
+        features = list(centroid.features())
+        points = np.fromiter((c for s, _ in features for c in s[0][:2]), dtype=np.float64, count=2 * len(features)).reshape(-1, 2)
+        closest, d = geometry.nearest(centres, points)
+        for (s, r), j, l in zip(features, closest.tolist(), d.tolist()):
+            min = j if l < 999 ** 2 else 0
             p = s[0]
-            for j in range(len(basin)):
-                b = basin.geometry(j)
-                v = b
-                c = geometry.polygon_centroid(pointVector(v))
-                l = geometry.length([Point(p[0], p[1]), c])
-                if l < d:
-                    d = l
-                    min = j
-            a = geometry.polygon_area(pointVector(basin.geometry(min)))
+            a = geometry.polygon_area(polygons[min])
             fi = r['fi']
             basins.append(Basin(r['id'], p[0], p[1], (a / 1E6), fi))
         return basins
@@ -87,10 +80,4 @@ class Builder():
         list
             A list of confluence objects.
         """
-        confluences = []
-        for i in range(len(confluence)):
-            s = confluence.geometry(i)
-            p = s[0]
-            r = confluence.record(i)
-            confluences.append(Confluence(r['id'], p[0], p[1],  bool(r['out'])))
-        return confluences
\ No newline at end of file
+        return [Confluence(r['id'], s[0][0], s[0][1], bool(r['out'])) for s, r in confluence.features()]
\ No newline at end of file
@@ -49,6 +49,22 @@ class VectorLayer(abc.ABC):
         """
         pass
 
+    def features(self):
+        """
+        Iterate over the geometry and attributes of every vector in the shapefile.
+
+        The default implementation reads each vector through geometry() and 
+        record(). Readers able to stream the shapefile in a single pass should 
+        override this to avoid the per vector lookups.
+
+        Yields
+        ------
+        tuple
+            (geometry, attributes) of each vector, in order.
+        """
+        for i in range(len(self)):
+            yield self.geometry(i), self.record(i)
+
     @abc.abstractmethod
     def __len__(self) -> int:
         """The number of vectors in the shapefile.
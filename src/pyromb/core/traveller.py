@@ -22,10 +22,19 @@ class Traveller:
 
     def __init__(self, catchment: Catchment):
         self._catchment: Catchment = catchment
-        self._colour = np.zeros(len(catchment._incidenceMatrixDS), dtype=int)
+        self._colour = bytearray(len(catchment._incidenceMatrixDS))
         self._us = catchment._incidenceMatrixUS
         self._ds = catchment._incidenceMatrixDS
         self._endSentinel = catchment._endSentinel
+        # Resolve the neighbours of every node once so that stepping through 
+        # the catchment is a list lookup rather than a scan of the matrices.
+        self._down: list[int] = []
+        self._dsReach: list[int] = []
+        for row in np.asarray(self._ds).tolist():
+            j = next((j for j, val in enumerate(row) if val != self._endSentinel), None)
+            self._down.append(self._endSentinel if j is None else row[j])
+            self._dsReach.append(j)
+        self._upstream: list[tuple] = [tuple(j for j in row if j != -1) for row in np.asarray(self._us).tolist()]
         self._pos = self.getStart()
 
     def position(self) -> int:
@@ -72,10 +81,10 @@ class Traveller:
         KeyError
             If the ith node does not exist.
         """
-        for j, val in enumerate(self._ds[i]):
-            if val != self._endSentinel:
-                return self._catchment._edges[j]
-        raise KeyError
+        j = self._dsReach[i]
+        if j is None:
+            raise KeyError
+        return self._catchment._edges[j]
     
     def getNode(self, i: int) -> Node:
         """The ith node.
@@ -108,13 +117,13 @@ class Traveller:
         int
             The index of the node. 
         """
-        for val in self._us[i]:
-            if val != -1:
+        while True:
+            for val in self._upstream[i]:
                 if self._colour[val] == 0:
-                    return self.top(val)
-                else:
-                    continue
-        return i
+                    i = val
+                    break
+            else:
+                return i
     
     def up(self, i: int) -> list:
         """Returns the immediate upstream nodes from position i. 
@@ -131,7 +140,7 @@ class Traveller:
         list
             The index of all upstream nodes.
         """
-        return [j for j in self._us[i] if -1 != j]
+        return list(self._upstream[i])
 
     def down(self, i: int) -> int:
         """The index of the immediate downstream node along the reach.
@@ -149,10 +158,7 @@ class Traveller:
         int
             The index of the downstream node or -1 if none.
         """
-        for val in self._ds[i]:
-            if val != -1:
-                return val
-        return self._endSentinel
+        return self._down[i]
     
     def next(self) -> int:
         """The next upstream node within the catchment available from the current position. 
@@ -220,4 +226,20 @@ class Traveller:
             The control file string.
         """
 
-        return model.getVector(self)
\ No newline at end of file
+        return model.getVector(self)
+
+    def writeVector(self, model: Model, fp) -> None:
+        """Write the vector for the desired hydrology model to a file.
+
+        Equivalent to fp.write(getVector(model)) but lets the model write 
+        the control file in parts rather than building it all in memory first.
+
+        Parameters
+        ----------
+        model : Model
+            The hydrology model to generate the control file for. 
+        fp : file-like
+            A text file-like object with a write method.
+        """
+
+        model.writeVector(self, fp)
\ No newline at end of file
@@ -1,13 +1,28 @@
 import math
+import numpy as np
 from ..core.geometry.point import Point
 
+# Target and point pairs compared at once by the nearest scan, bounds its memory use.
+# Searches needing more than one block use a KD-tree when SciPy is installed
+_NEAREST_BLOCK = 1 << 20
+
+# Neighbours taken from the KD-tree for each point, to resolve ties to the lowest index
+_KD_CANDIDATES = 4
+
+# Points in a list before length measures it as an array, below this the plain loop is faster
+_ARRAY_LENGTH_MIN = 300
+
+# Points in an array before length uses the compiled kernel, when Numba is installed.
+# Loading the kernel costs a few tenths of a second, so only very long lines are worth it
+_KERNEL_LENGTH_MIN = 1_000_000
+
 def length(vertices:list) -> float:
     """Calculate the cartesian length of a vector of co-ordinates. 
 
     Parameters
     ----------
-    vertices : list
-        The list of co-ordinates to calculate the length.
+    vertices : list | np.ndarray
+        The list of points, or (n, 2) array of co-ordinates, to calculate the length.
 
     Returns
     -------
@@ -15,22 +30,50 @@ def length(vertices:list) -> float:
         The vector length.
     """
 
+    if isinstance(vertices, np.ndarray) or len(vertices) >= _ARRAY_LENGTH_MIN:
+        coords = _coordinates(vertices)
+        kernel = _compiledLength() if len(coords) >= _KERNEL_LENGTH_MIN else None
+        return float(kernel(coords) if kernel else _arrayLength(coords))
+
+    # Short vectors, numpy setup would outweigh the arithmetic, both paths give the same total
     length = 0
     for i in range(len(vertices) - 1):
-        length += math.sqrt( \
-        math.pow((vertices[i+1].coordinates()[0] - vertices[i].coordinates()[0]), 2) + \
-        math.pow((vertices[i+1].coordinates()[1] - vertices[i].coordinates()[1]), 2)
-        )
+        length += segment_length(vertices[i], vertices[i + 1])
     return length
 
+def segment_length(a: Point, b: Point) -> float:
+    """Calculate the cartesian length of the segment between two points.
+
+    The same arithmetic length uses for each segment, so a running total of 
+    segment lengths matches the length of the whole vector.
+
+    Parameters
+    ----------
+    a : Point
+        The start of the segment.
+    b : Point
+        The end of the segment.
+
+    Returns
+    -------
+    float
+        The segment length.
+    """
+
+    ax, ay = a.coordinates()
+    bx, by = b.coordinates()
+    dx = bx - ax
+    dy = by - ay
+    return math.sqrt(dx * dx + dy * dy)
+
 # Shoelace algorithm
 def polygon_area(vertices:list) -> float:
     """Calculate the cartesian area of a polygon.
 
     Parameters
     ----------
-    vertices : list
-        A list of points representing the polygon.
+    vertices : list | np.ndarray
+        A list of points, or (n, 2) array of co-ordinates, representing the polygon.
 
     Returns
     -------
@@ -38,18 +81,9 @@ def polygon_area(vertices:list) -> float:
         The polygon area.
     """
 
-    psum = 0
-    nsum = 0
-    for i in range(len(vertices)):
-        sindex = (i + 1) % len(vertices)
-        prod = vertices[i].coordinates()[0] * vertices[sindex].coordinates()[1]
-        psum += prod
-
-    for i in range(len(vertices)):
-        sindex = (i + 1) % len(vertices)
-        prod = vertices[sindex].coordinates()[0] * vertices[i].coordinates()[1]
-        nsum += prod
-
+    x, y = _coordinates(vertices).T
+    psum = _sequentialSum(x * np.roll(y, -1))
+    nsum = _sequentialSum(np.roll(x, -1) * y)
     return abs(1/2*(psum - nsum))
 
 def polygon_centroid(vertices:list) -> Point:
@@ -57,8 +91,8 @@ def polygon_centroid(vertices:list) -> Point:
 
     Parameters
     ----------
-    vertices : list
-        A list of points representing the polygon.
+    vertices : list | np.ndarray
+        A list of points, or (n, 2) array of co-ordinates, representing the polygon.
 
     Returns
     -------
@@ -66,17 +100,146 @@ def polygon_centroid(vertices:list) -> Point:
         The centroid.
     """
     
-    sumx = 0
-    sumy = 0
-    suma = 0
-    for i in range(len(vertices) - 1):
-        p = [(vertices[i].coordinates()[0], vertices[i].coordinates()[1]), (vertices[i+1].coordinates()[0], vertices[i+1].coordinates()[1])]
-        sumx += (p[0][0] + p[1][0]) * (p[0][0] * p[1][1] - p[1][0] * p[0][1])
-        sumy += (p[0][1] + p[1][1]) * (p[0][0] * p[1][1] - p[1][0] * p[0][1])
-        suma += p[0][0] * p[1][1] - p[1][0] * p[0][1]
+    x, y = _coordinates(vertices).T
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    sumx = _sequentialSum((x[:-1] + x[1:]) * cross)
+    sumy = _sequentialSum((y[:-1] + y[1:]) * cross)
+    suma = _sequentialSum(cross)
 
     A = 0.5 * suma
     Cx = (1 / (6 * A)) * sumx
     Cy = (1 / (6 * A)) * sumy
     
-    return Point(Cx, Cy)
\ No newline at end of file
+    return Point(Cx, Cy)
+
+def nearest(targets: np.ndarray, points: np.ndarray) -> tuple:
+    """Find the target closest to each of a set of points.
+
+    Compares squared distances between every target and point, a block of 
+    points at a time so the memory used stays bounded. Searches larger than 
+    one block query a KD-tree over the targets instead when SciPy is installed.
+    Either way a point equally close to several targets gets the lowest index.
+
+    Parameters
+    ----------
+    targets : np.ndarray
+        (m, 2) array of the co-ordinates to search.
+    points : np.ndarray
+        (n, 2) array of the co-ordinates to find the closest target to.
+
+    Returns
+    -------
+    tuple
+        ((n,) index of the closest target, (n,) squared distance to it) for each point.
+    """
+
+    if len(points) == 0:
+        return (np.empty(0, dtype=np.int64), np.empty(0))
+    tree = _kdTree() if len(targets) * len(points) > _NEAREST_BLOCK else None
+    if not tree:
+        return _scanNearest(targets, points)
+
+    # Exact squared distances to the few nearest candidates, lowest index among the closest
+    k = min(_KD_CANDIDATES, len(targets))
+    d, candidates = tree(targets).query(points, k=k)
+    d = d.reshape(len(points), k)
+    candidates = candidates.reshape(len(points), k)
+    dx = targets[candidates, 0] - points[:, 0, None]
+    dy = targets[candidates, 1] - points[:, 1, None]
+    d2 = dx * dx + dy * dy
+    sqdist = d2.min(axis=1)
+    idx = np.where(d2 == sqdist[:, None], candidates, len(targets)).min(axis=1).astype(np.int64)
+
+    # Points whose candidates are all about as close may tie with a target beyond them
+    if k < len(targets):
+        crowded = np.flatnonzero(d[:, -1] <= d[:, 0] * (1 + 1e-9))
+        if len(crowded):
+            idx[crowded], sqdist[crowded] = _scanNearest(targets, points[crowded])
+    return (idx, sqdist)
+
+def _scanNearest(targets: np.ndarray, points: np.ndarray) -> tuple:
+    """nearest by comparing every target and point, a block of points at a time."""
+
+    idx = np.empty(len(points), dtype=np.int64)
+    sqdist = np.empty(len(points))
+    step = max(1, _NEAREST_BLOCK // max(1, len(targets)))
+    for start in range(0, len(points), step):
+        block = points[start:start + step]
+        dx = targets[:, 0, None] - block[None, :, 0]
+        dy = targets[:, 1, None] - block[None, :, 1]
+        d = dx * dx + dy * dy
+        i = d.argmin(axis=0)
+        idx[start:start + step] = i
+        sqdist[start:start + step] = d[i, np.arange(len(block))]
+    return (idx, sqdist)
+
+_kdTreeClass = None
+
+def _kdTree():
+    """SciPy's cKDTree, or False when SciPy is not installed.
+
+    SciPy is imported on the first large search rather than with the module.
+    """
+
+    global _kdTreeClass
+    if _kdTreeClass is None:
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            cKDTree = False
+        _kdTreeClass = cKDTree
+    return _kdTreeClass
+
+def _coordinates(vertices:list) -> np.ndarray:
+    """The (n, 2) array of co-ordinates of a list of points."""
+
+    if isinstance(vertices, np.ndarray):
+        return np.asarray(vertices, dtype=np.float64)
+    n = len(vertices)
+    coords = (c for v in vertices for c in v.coordinates())
+    return np.fromiter(coords, dtype=np.float64, count=2 * n).reshape(n, 2)
+
+def _sequentialSum(terms: np.ndarray) -> float:
+    """Sum the terms in order, matching a running total built in a loop."""
+
+    return float(np.cumsum(terms)[-1]) if len(terms) else 0.0
+
+def _arrayLength(coords: np.ndarray) -> float:
+    """The length of an (n, 2) co-ordinate array.
+
+    Segments are measured and totalled in the same order and precision as 
+    the short vector loop in length and _lengthKernel, so every path gives 
+    bit-identical totals whether or not the kernel is used.
+    """
+
+    d = np.diff(coords, axis=0)
+    return _sequentialSum(np.sqrt(d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1]))
+
+def _lengthKernel(coords: np.ndarray) -> float:
+    """Loop form of _arrayLength, compiled by _compiledLength."""
+
+    s = 0.0
+    for i in range(coords.shape[0] - 1):
+        dx = coords[i + 1, 0] - coords[i, 0]
+        dy = coords[i + 1, 1] - coords[i, 1]
+        s += math.sqrt(dx * dx + dy * dy)
+    return s
+
+_compiledKernel = None
+
+def _compiledLength():
+    """_lengthKernel compiled with Numba, or False when Numba is not installed.
+
+    Numba is imported on the first call rather than with the module, so the 
+    import cost is only paid by runs that measure a very long line.
+    """
+
+    global _compiledKernel
+    if _compiledKernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _compiledKernel = False
+        else:
+            _compiledKernel = njit(cache=True)(_lengthKernel)
+    return _compiledKernel
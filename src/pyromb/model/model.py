@@ -20,3 +20,19 @@ class Model(abc.ABC):
         """
     
         pass
+
+    def writeVector(self, traveller, fp) -> None:
+        """Write the control text file for the relevant hydrology model to a file.
+
+        Models which can produce their control file in parts should override 
+        this to write each part as it is built rather than the whole file at once.
+
+        Parameters
+        ----------
+        traveller : Traveller
+            The traveller to traverse the catchment.
+        fp : file-like
+            A text file-like object with a write method. 
+        """
+
+        fp.write(self.getVector(traveller))
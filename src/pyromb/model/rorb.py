@@ -4,9 +4,13 @@ from ..core.attributes.basin import Basin
 from ..core.attributes.confluence import Confluence
 from ..core.attributes.reach import ReachType
 from .. import resources
+import io
 import json
 import os
 
+# Reach types whose control vector entry carries no slope
+_SLOPELESS_REACHES = frozenset((ReachType.NATURAL, ReachType.DROWNED))
+
 class VectorBlock():
     """
     Builds the vector block for the RORB control file.
@@ -123,10 +127,10 @@ class VectorBlock():
         if code[0] in (1, 2, 5):
             try:
                 r = traveller.getReach(code[1])
-                if (r.type == ReachType.NATURAL) or (r.type == ReachType.DROWNED):
+                if r.type in _SLOPELESS_REACHES:
                     ret = f"{code[0]},{r.type.value},{r.length() / 1000:.3f},-99"
                 else:
-                    ret = f"{code[0]},{r.type.value},{r.length() / 1000:.3f},{r.getSlope()},-99"
+                    ret = f"{code[0]},{r.type.value},{r.length() / 1000:.3f},{r.slope},-99"
             except:
                 ret = f"{7}\n\n{0}"
         
@@ -498,6 +502,21 @@ class RORB(Model):
         pass
     
     def getVector(self, traveller: Traveller) -> str:
+        buf = io.StringIO()
+        self.writeVector(traveller, buf)
+        return buf.getvalue()
+
+    def writeVector(self, traveller: Traveller, fp) -> None:
+        """Write the control vector to fp, the graphics block followed by the vector block.
+
+        Parameters
+        ----------
+        traveller : Traveller
+            The traveller traversing this catchment.
+        fp : file-like
+            A text file-like object with a write method.
+        """
+
         traveller.next()
         vectorBlock = VectorBlock()
         graphicBlock = GraphicsBlock()
@@ -506,4 +525,5 @@ class RORB(Model):
             vectorBlock.step(traveller)
             graphicBlock.step(vectorBlock.state[-1], traveller)
 
-        return graphicBlock.build() + vectorBlock.build(traveller)
\ No newline at end of file
+        fp.write(graphicBlock.build())
+        fp.write(vectorBlock.build(traveller))
\ No newline at end of file
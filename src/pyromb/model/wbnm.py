@@ -3,8 +3,43 @@ from ..core.traveller import Traveller
 from ..core.attributes.basin import Basin
 from ..core.attributes.confluence import Confluence
 from ..core.geometry.point import Point
+from .. import resources
+import io
 import numpy as np
 
+# Kinds of catchment node as far as WBNM is concerned.
+_BASIN = 0
+_OUTLET = 1
+_CONFLUENCE = 2
+
+def _nodeKind(node) -> int:
+    if isinstance(node, Basin):
+        return _BASIN
+    if isinstance(node, Confluence) and node.isOut:
+        return _OUTLET
+    return _CONFLUENCE
+
+def _numberBlock(value) -> str:
+    """A right aligned value block for a number known to be an int or float."""
+
+    block = f"{value:>12}"
+    if len(block) > 12:
+        raise ValueError(f"Maximum string length is 12 characters, but {value} was {len(block)}")
+    return block
+
+def _stringBlock(string: str) -> str:
+    """A left aligned value block for a value known to be a string."""
+
+    block = f"{string:<12}"
+    if len(block) > 12:
+        raise ValueError(f"Maximum string length is 12 characters, but {string} was {len(block)}")
+    return block
+
+def _roundColumn(column: np.ndarray, ndigits: int) -> np.ndarray:
+    """Round each value with the builtin round, which np.round does not match."""
+
+    return np.array([round(v, ndigits) for v in column.tolist()], dtype=column.dtype)
+
 class WBNM(Model):
     """The WBNM class creates a templated runfile based on a catchment 
     diagram produced in GIS.
@@ -23,19 +58,42 @@ class WBNM(Model):
                        "STREAM_ROUTING_TYPE": "#####ROUTING",
                        "STREAM_LAG_FACTOR": 1}
         self._subAreas: list[SubArea] = []
+        self._valFmt: dict = {}
+        self._nodeKinds: list[int] = []
+        # Column-wise copies of the subarea data used to render the blocks.
+        self._names = np.empty(0, dtype=object)
+        self._x = np.empty(0, dtype=object)
+        self._y = np.empty(0, dtype=object)
+        self._outX = np.empty(0, dtype=object)
+        self._outY = np.empty(0, dtype=object)
+        self._area = np.empty(0, dtype=object)
+        self._fi = np.empty(0, dtype=object)
+        self._stream = np.empty(0, dtype=bool)
+        self._dsNames = np.empty(0, dtype=object)
 
     def getVector(self, traveller: Traveller):
+        buf = io.StringIO()
+        self.writeVector(traveller, buf)
+        return buf.getvalue()
+
+    def writeVector(self, traveller: Traveller, fp) -> None:
+        """Write the runfile to fp one code block at a time.
+
+        Parameters
+        ----------
+        traveller : Traveller
+            The traveller traversing this catchment.
+        fp : file-like
+            A text file-like object with a write method.
+        """
+
         self._subAreaFactory(traveller)
-        return \
-            self._createCodeBlock("preamble")   + \
-            self._createCodeBlock("status")     + \
-            self._createCodeBlock("display")    + \
-            self._createCodeBlock("topology")   + \
-            self._createCodeBlock("surface")    + \
-            self._createCodeBlock("flowpaths")  + \
-            self._createCodeBlock("local_structures")  + \
-            self._createCodeBlock("outlet_structures")  + \
-            self._createCodeBlock("storm")
+        # Format the model values once, they are repeated throughout the runfile.
+        self._valFmt = {k: self._createValueBlock(v) for k, v in self.values.items()}
+        for i, blockName in enumerate(self._BLOCK_METHODS):
+            if i:
+                fp.write("\n\n\n")
+            fp.write(self._createCodeBlock(blockName))
 
     def _subAreaFactory(self, traveller: Traveller):
         """Produces a WBNM subarea.
@@ -49,16 +107,33 @@ class WBNM(Model):
             The traveller traversing this catchment.
         """
         
+        position = traveller.position
+        getNode = traveller.getNode
+        up = traveller.up
+        nextAbsolute = traveller.nextAbsolute
+        end = traveller._endSentinel
+
+        # Classify every node once so the walk compares ints rather than types.
+        self._nodeKinds = [_nodeKind(v) for v in traveller._catchment._vertices]
+        kinds = self._nodeKinds
+
+        # Every basin becomes a subarea, size the list up front.
+        self._subAreas = [None] * kinds.count(_BASIN)
+        k = 0
+
         # go to the very top of the catchment.
         traveller.next()
         # Traverse the catchment and build each subarea.
-        while(traveller.position() != traveller._endSentinel):
-            if isinstance(traveller.getNode(traveller.position()), Basin):
-                subArea = SubArea(traveller.getNode(traveller.position()))
-                subArea.streamChannel = len(traveller.up(traveller.position())) != 0
-                subArea.dsNodeIndex = self._getDsIndex(traveller, traveller.position())
-                self._subAreas.append(subArea)
-            traveller.nextAbsolute()
+        p = position()
+        while(p != end):
+            if kinds[p] == _BASIN:
+                subArea = SubArea(getNode(p))
+                subArea.streamChannel = bool(up(p))
+                subArea.dsNodeIndex = self._getDsIndex(traveller, p)
+                self._subAreas[k] = subArea
+                k += 1
+            p = nextAbsolute()
+        del self._subAreas[k:]
         for s in self._subAreas:
             if s.dsNodeIndex == traveller._endSentinel:
                 node = traveller.getNode(traveller.getStart())
@@ -67,19 +142,43 @@ class WBNM(Model):
             else:
                 s.dsSubArea = self._getDSSubArea(traveller, s.dsNodeIndex)
                 s.out = self._getOutCoordinate(s)
+        self._subAreaColumns()
+
+    def _subAreaColumns(self):
+        """Copy the subarea data into parallel arrays, one per field.
+
+        The code blocks are rendered column by column so the scaling and 
+        formatting can be done on whole arrays rather than per subarea. The 
+        numeric columns are object arrays, each value keeps its own type so 
+        ints are written as ints, as the scalar value blocks do.
+        """
+
+        subAreas = self._subAreas
+        self._names = np.array([s.name for s in subAreas], dtype=object)
+        self._x = np.array([s.x for s in subAreas], dtype=object)
+        self._y = np.array([s.y for s in subAreas], dtype=object)
+        self._outX = np.array([s.out.coordinates()[0] for s in subAreas], dtype=object)
+        self._outY = np.array([s.out.coordinates()[1] for s in subAreas], dtype=object)
+        self._area = np.array([s.area for s in subAreas], dtype=object)
+        self._fi = np.array([s.fi for s in subAreas], dtype=object)
+        self._stream = np.array([s.streamChannel for s in subAreas], dtype=bool)
+        self._dsNames = np.array([s.dsSubArea.name for s in subAreas], dtype=object)
 
     def _getDsIndex(self, traveller: Traveller, i: int):
         """Get the index of the downstream subarea from the current position i.
         Confluence are not considered subareas in WBNM and will be passed over. 
         """
 
-        ds = traveller.down(i)
-        if isinstance(traveller.getNode(ds), Basin):
-            return ds
-        if isinstance(traveller.getNode(ds), Confluence):
-            if traveller.getNode(ds).isOut() == True:
+        kinds = self._nodeKinds
+        down = traveller.down
+        # An acyclic path passes through each node at most once
+        for _ in range(len(kinds)):
+            i = down(i)
+            if kinds[i] == _BASIN:
+                return i
+            if kinds[i] == _OUTLET:
                 return traveller._endSentinel
-        return self._getDsIndex(traveller, ds)
+        raise ValueError(f"No downstream subarea or outlet within {len(kinds)} nodes, the downstream links form a cycle")
 
     def _getDSSubArea(self, traveller: Traveller, index):
         """Get the downstream subarea corresponding to an index.
@@ -129,19 +228,28 @@ class WBNM(Model):
         The value block is 12 characters wide with space padding.  
         """
 
-        try:
-            string = str(value)
-            if len(string) > 12:
-                raise ValueError(f"Maximum string length is 12 characters, but {value} was {len(value)}")
-        except ValueError:
-            raise ValueError("cannot parse argument into a string")
         if isinstance(value, float) or isinstance(value, int):
-            return string.rjust(12, ' ')
-        elif isinstance(string, str):
-            return string.ljust(12, ' ')
-        else:
-            raise ValueError("value must be a string or float")
+            return _numberBlock(value)
+        return _stringBlock(str(value))
     
+    def _createValueColumn(self, column: np.ndarray) -> np.ndarray:
+        """Create the value blocks for a whole column of values at once.
+
+        The array equivalent of _createValueBlock, int and float values are 
+        right aligned and all others are left aligned within the 12 character 
+        block. Alignment is decided per value, as object columns such as the 
+        subarea names may hold numbers.
+        """
+
+        values = column.tolist()
+        strings = np.array([str(v) for v in values], dtype=str)
+        if strings.size == 0:
+            return strings.astype("U12")
+        if np.char.str_len(strings).max() > 12:
+            raise ValueError("Maximum string length is 12 characters")
+        numeric = np.array([isinstance(v, (int, float)) for v in values], dtype=bool)
+        return np.where(numeric, np.char.rjust(strings, 12), np.char.ljust(strings, 12))
+
     def _createCodeBlock(self, blockName: str):
         """A code block is the grouping of values per the Runfile specification.
 
@@ -154,106 +262,72 @@ class WBNM(Model):
         #####END_STATUS_BLOCK##############|###########|###########|###########|\n
         """
 
-        if blockName == "preamble":
-            return self._blockPreamble() + "\n\n\n"
-        if blockName == "status":
-            return self._blockStatus() + "\n\n\n"
-        if blockName == "display":
-            return self._blockDisplay() + "\n\n\n"
-        if blockName == "topology":
-            return self._blockTopology() + "\n\n\n"
-        if blockName == "surface":
-            return self._blockSurface() + "\n\n\n"
-        if blockName == "flowpaths":
-            return self._blockFlowPaths() + "\n\n\n"
-        if blockName == "local_structures":
-            return self._blockLocalStructures() + "\n\n\n"
-        if blockName == "outlet_structures":
-            return self._blockOutletStructures() + "\n\n\n"
-        if blockName == "storm":
-            return self._blockStorm()
+        return getattr(self, self._BLOCK_METHODS[blockName])()
     
     def _blockPreamble(self):
         """Get the PREAMBLE_BLOCK, content is optional so not implementing at this stage
         """
 
-        return \
-        "#####START_PREAMBLE_BLOCK##########|###########|###########|###########|\n" + \
-        "\n" * 8 + \
-        "#####END_PREAMBLE_BLOCK############|###########|###########|###########|"
+        return resources.wbnm.PREAMBLE_BLOCK
     
     def _blockStatus(self):
         """ Get the STATUS_BLOCK, only implementing required value blocks
         """
 
         return \
-        "#####START_STATUS_BLOCK############|###########|###########|###########|\n" + \
-        "\n" * 3 + \
-        f"{self._createValueBlock(self.values['VERSION_NUMBER'])}\n" + \
-        "#####END_STATUS_BLOCK##############|###########|###########|###########|"
+        resources.wbnm.STATUS_HEADER + \
+        f"{self._valFmt['VERSION_NUMBER']}\n" + \
+        resources.wbnm.STATUS_FOOTER
     
     def _blockDisplay(self):
         """Get the DISPLAY_BLOCK, display block values are optional, not implementing at this stage
         """
 
-        return \
-        "#####START_DISPLAY_BLOCK###########|###########|###########|###########|\n" + \
-        f"{self._createValueBlock(0)}{self._createValueBlock(0)}{self._createValueBlock(0)}{self._createValueBlock(0)}\n" + \
-        f"{self._createValueBlock('none')}\n" + \
-        f"{self._createValueBlock(0)}{self._createValueBlock(0)}{self._createValueBlock(0)}{self._createValueBlock(0)}{self._createValueBlock(0)}{self._createValueBlock(0)}\n" + \
-        "#####END_DISPLAY_BLOCK#############|###########|###########|###########|"
+        return resources.wbnm.DISPLAY_BLOCK
     
     def _blockTopology(self):
         """Get the TOPOLOGY_BLOCK, only implementing necessary values at this stage. 
         """
 
-        insertSubArea = ""
-        for s in self._subAreas:
-            insertSubArea += self._createValueBlock(s.name) + \
-            self._createValueBlock(round(s.coordinates()[0], 3)) + self._createValueBlock(round(s.coordinates()[1], 3)) + \
-            self._createValueBlock(round(s.out.coordinates()[0], 3)) + self._createValueBlock(round(s.out.coordinates()[1], 3)) + \
-            " " + self._createValueBlock(s.dsSubArea.name) + "\n"
+        vc = self._createValueColumn
+        rows = vc(self._names)
+        for column in (self._x, self._y, self._outX, self._outY):
+            rows = np.char.add(rows, vc(_roundColumn(column, 3)))
+        rows = np.char.add(np.char.add(rows, " "), vc(self._dsNames))
+        insertSubArea = "".join(np.char.add(rows, "\n").tolist())
         return \
-        "#####START_TOPOLOGY_BLOCK###########|###########|###########|###########|\n" + \
-        f"{self._createValueBlock(len(self._subAreas))} {self._createValueBlock(self.values['CATCHMENT_NAME'])}\n" + \
-        f"{insertSubArea}" +\
-        "#####END_TOPOLOGY_BLOCK#############|###########|###########|###########|"
+        resources.wbnm.TOPOLOGY_HEADER + \
+        f"{_numberBlock(len(self._subAreas))} {self._valFmt['CATCHMENT_NAME']}\n" + \
+        insertSubArea + \
+        resources.wbnm.TOPOLOGY_FOOTER
     
     def _blockSurface(self):
-        insertSurface = ""
-        for s in self._subAreas:
-            insertSurface += f"{self._createValueBlock(s.name)}{self._createValueBlock(round(s.area * 100, 2))}{self._createValueBlock(round(s.fi, 2))}\n"
+        vc = self._createValueColumn
+        rows = np.char.add(vc(self._names), vc(_roundColumn(self._area * 100, 2)))
+        rows = np.char.add(rows, vc(_roundColumn(self._fi, 2)))
+        insertSurface = "".join(np.char.add(rows, "\n").tolist())
         return \
-        "#####START_SURFACES_BLOCK##########|###########|###########|###########|\n" + \
-        f"{self._createValueBlock(self.values['NONLIN_EXP'])}{self._createValueBlock(self.values['LAG_PARAM'])}{self._createValueBlock(self.values['IMP_LAG_FACT'])}\n" + \
-        f"{self._createValueBlock(self.values['DISCHARGE_SWITCH'])}\n" + \
+        resources.wbnm.SURFACES_HEADER + \
+        f"{self._valFmt['NONLIN_EXP']}{self._valFmt['LAG_PARAM']}{self._valFmt['IMP_LAG_FACT']}\n" + \
+        f"{self._valFmt['DISCHARGE_SWITCH']}\n" + \
         insertSurface + \
-        "#####END_SURFACES_BLOCK############|###########|###########|###########|"
+        resources.wbnm.SURFACES_FOOTER
 
     def _blockFlowPaths(self):
-        insertFlow = ""
-        for s in self._subAreas:
-            if s.streamChannel:
-                insertFlow += f"{self._createValueBlock(s.name)}\n" + \
-                    f"{self._createValueBlock(self.values['STREAM_ROUTING_TYPE'])}\n" + \
-                    f"{self._createValueBlock(self.values['STREAM_LAG_FACTOR'])}\n"
+        flowTail = f"{self._valFmt['STREAM_ROUTING_TYPE']}\n{self._valFmt['STREAM_LAG_FACTOR']}\n"
+        rows = self._createValueColumn(self._names[self._stream])
+        insertFlow = "".join(np.char.add(rows, "\n" + flowTail).tolist())
         return \
-        "#####START_FLOWPATHS_BLOCK#########|###########|###########|###########|\n" + \
-        f"{len([x for x in self._subAreas if x.streamChannel])}\n" + \
+        resources.wbnm.FLOWPATHS_HEADER + \
+        f"{int(self._stream.sum())}\n" + \
         insertFlow + \
-        "#####END_FLOWPATHS_BLOCK###########|###########|###########|###########|"
+        resources.wbnm.FLOWPATHS_FOOTER
     
     def _blockLocalStructures(self):
-        return \
-        "#####START_LOCAL_STRUCTURES_BLOCK##|###########|###########|###########|\n" + \
-        "0\n" + \
-        "#####END_LOCAL_STRUCTURES_BLOCK####|###########|###########|###########|"
+        return resources.wbnm.LOCAL_STRUCTURES_BLOCK
 
     def _blockOutletStructures(self):
-       return \
-       "#####START_OUTLET_STRUCTURES_BLOCK#|###########|###########|###########|\n" + \
-       "0\n" + \
-       "#####END_OUTLET_STRUCTURES_BLOCK###|###########|###########|###########|"
+        return resources.wbnm.OUTLET_STRUCTURES_BLOCK
 
     def _blockStorm(self):
         """Stormblock is a template at this stage. Catchment specific information will  
@@ -261,37 +335,18 @@ class WBNM(Model):
         the WBNM runfile. 
         """
 
-        return \
-        "#####START_STORM_BLOCK#############|###########|###########|###########|\n" + \
-        f"{self._createValueBlock(1)}\n" + \
-        "#####START_STORM#1\n" + \
-        "1%AEP dura/patt spectrum  - losses 27/4 GLOBAL - ARF = Calculated from ARR\n" + \
-        f"{self._createValueBlock(1.0)}\n" + \
-        f"{self._createValueBlock(5.0)}\n" + \
-        "#####START_DESIGN_RAIN_ARR\n" + \
-        f"{self._createValueBlock(1.0)}{self._createValueBlock(-1)}{self._createValueBlock(-1)}{self._createValueBlock(-1)}\n" + \
-        "IFD_DATA_IN_GAUGE_FILES\n" + \
-        f"{self._createValueBlock(2)}\n" + \
-        "sorell_lower\n" + \
-        "sorell_upper\n" + \
-        "PAT_DATA_IN_REGION_FILE\n" + \
-        "sorell_increments.csv\n" + \
-        "CAT_DATA_IN_CATCHMENT_FILE\n" + \
-        "sorell_catchment_data.txt\n" + \
-        "#####END_DESIGN_RAIN_ARR\n" + \
-        "#####START_CALC_RAINGAUGE_WEIGHTS\n" + \
-        "#####END_CALC_RAINGAUGE_WEIGHTS\n" + \
-        "#####START_LOSS_RATES\n" + \
-        f"{self._createValueBlock('GLOBAL')}{self._createValueBlock(27.0)}{self._createValueBlock(4.0)}{self._createValueBlock(0.0)}\n" + \
-        "#####END_LOSS_RATES\n" + \
-        "#####START_RECORDED_HYDROGRAPHS\n" + \
-        f"{self._createValueBlock(0)}\n" + \
-        "#####END_RECORDED_HYDROGRAPHS\n" + \
-        "#####START_IMPORTED_HYDROGRAPHS\n" + \
-        f"{self._createValueBlock(0)}\n" + \
-        "#####END_IMPORTED_HYDROGRAPHS\n" + \
-        "#####END_STORM#1\n" + \
-        "#####END_STORM_BLOCK###############|###########|###########|###########|"
+        return resources.wbnm.STORM_BLOCK
+
+    # Block method names rather than functions, so subclasses can override a block.
+    _BLOCK_METHODS = {"preamble": "_blockPreamble",
+                      "status": "_blockStatus",
+                      "display": "_blockDisplay",
+                      "topology": "_blockTopology",
+                      "surface": "_blockSurface",
+                      "flowpaths": "_blockFlowPaths",
+                      "local_structures": "_blockLocalStructures",
+                      "outlet_structures": "_blockOutletStructures",
+                      "storm": "_blockStorm"}
 
 class SubArea(Basin):
     """SubArea as defined by the WBNM specification. 
@@ -304,17 +359,19 @@ class SubArea(Basin):
     some additional attributes to the Basin used by WBNM.
     """
 
+    __slots__ = ("_out", "_streamChannel", "_dsNodeIndex", "_dsSubArea")
+
     def __init__(self, basin: Basin):
         self._x: float = basin._x
-        self._y:float = basin._y
-        self._type: int = basin._type
+        self._y: float = basin._y
+        self._coords: tuple = basin._coords
         self._name: str = basin._name
-        self._out: Point
-        self._streamChannel: bool
+        self._out: Point = None
+        self._streamChannel: bool = False
         self._area: float = basin._area
         self._fi: float = basin._fi
-        self._dsNodeIndex: int
-        self._dsSubArea: SubArea
+        self._dsNodeIndex: int = -1
+        self._dsSubArea: SubArea = None
 
     @property
     def x(self) -> tuple:
@@ -323,6 +380,7 @@ class SubArea(Basin):
     @x.setter
     def x(self, value: tuple):
         self._x = value
+        self._coords = (self._x, self._y)
 
     @property
     def y(self) -> tuple:
@@ -331,6 +389,7 @@ class SubArea(Basin):
     @y.setter
     def y(self, value: tuple):
         self._y = value
+        self._coords = (self._x, self._y)
 
     @property
     def out(self) -> Point:
@@ -348,14 +407,6 @@ class SubArea(Basin):
     def streamChannel(self, value: bool):
         self._streamChannel = value
 
-    @property
-    def area(self) -> float:
-        return self._area
-    
-    @area.setter
-    def area(self, value: float):
-        self._area = value
-
     @property
     def fractionImp(self) -> float:
         return self._fi
@@ -1 +1,2 @@
-from . import rorb
\ No newline at end of file
+from . import rorb
+from . import wbnm
\ No newline at end of file
@@ -0,0 +1,57 @@
+PREAMBLE_BLOCK = "#####START_PREAMBLE_BLOCK##########|###########|###########|###########|\n" + "\n" * 8 + "#####END_PREAMBLE_BLOCK############|###########|###########|###########|"
+
+STATUS_HEADER = "#####START_STATUS_BLOCK############|###########|###########|###########|\n" + "\n" * 3
+STATUS_FOOTER = "#####END_STATUS_BLOCK##############|###########|###########|###########|"
+
+DISPLAY_BLOCK = (
+    "#####START_DISPLAY_BLOCK###########|###########|###########|###########|\n"
+    f"{0:>12}{0:>12}{0:>12}{0:>12}\n"
+    f"{'none':<12}\n"
+    f"{0:>12}{0:>12}{0:>12}{0:>12}{0:>12}{0:>12}\n"
+    "#####END_DISPLAY_BLOCK#############|###########|###########|###########|"
+)
+
+TOPOLOGY_HEADER = "#####START_TOPOLOGY_BLOCK###########|###########|###########|###########|\n"
+TOPOLOGY_FOOTER = "#####END_TOPOLOGY_BLOCK#############|###########|###########|###########|"
+
+SURFACES_HEADER = "#####START_SURFACES_BLOCK##########|###########|###########|###########|\n"
+SURFACES_FOOTER = "#####END_SURFACES_BLOCK############|###########|###########|###########|"
+
+FLOWPATHS_HEADER = "#####START_FLOWPATHS_BLOCK#########|###########|###########|###########|\n"
+FLOWPATHS_FOOTER = "#####END_FLOWPATHS_BLOCK###########|###########|###########|###########|"
+
+LOCAL_STRUCTURES_BLOCK = "#####START_LOCAL_STRUCTURES_BLOCK##|###########|###########|###########|\n0\n#####END_LOCAL_STRUCTURES_BLOCK####|###########|###########|###########|"
+OUTLET_STRUCTURES_BLOCK = "#####START_OUTLET_STRUCTURES_BLOCK#|###########|###########|###########|\n0\n#####END_OUTLET_STRUCTURES_BLOCK###|###########|###########|###########|"
+
+STORM_BLOCK = (
+    "#####START_STORM_BLOCK#############|###########|###########|###########|\n"
+    f"{1:>12}\n"
+    "#####START_STORM#1\n"
+    "1%AEP dura/patt spectrum  - losses 27/4 GLOBAL - ARF = Calculated from ARR\n"
+    f"{1.0:>12}\n"
+    f"{5.0:>12}\n"
+    "#####START_DESIGN_RAIN_ARR\n"
+    f"{1.0:>12}{-1:>12}{-1:>12}{-1:>12}\n"
+    "IFD_DATA_IN_GAUGE_FILES\n"
+    f"{2:>12}\n"
+    "sorell_lower\n"
+    "sorell_upper\n"
+    "PAT_DATA_IN_REGION_FILE\n"
+    "sorell_increments.csv\n"
+    "CAT_DATA_IN_CATCHMENT_FILE\n"
+    "sorell_catchment_data.txt\n"
+    "#####END_DESIGN_RAIN_ARR\n"
+    "#####START_CALC_RAINGAUGE_WEIGHTS\n"
+    "#####END_CALC_RAINGAUGE_WEIGHTS\n"
+    "#####START_LOSS_RATES\n"
+    f"{'GLOBAL':<12}{27.0:>12}{4.0:>12}{0.0:>12}\n"
+    "#####END_LOSS_RATES\n"
+    "#####START_RECORDED_HYDROGRAPHS\n"
+    f"{0:>12}\n"
+    "#####END_RECORDED_HYDROGRAPHS\n"
+    "#####START_IMPORTED_HYDROGRAPHS\n"
+    f"{0:>12}\n"
+    "#####END_IMPORTED_HYDROGRAPHS\n"
+    "#####END_STORM#1\n"
+    "#####END_STORM_BLOCK###############|###########|###########|###########|"
+)
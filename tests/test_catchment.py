@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pyromb
+from pyromb.core.attributes.basin import Basin
+from pyromb.core.attributes.confluence import Confluence
+from pyromb.core.attributes.reach import Reach
+
+class TestConnect(unittest.TestCase):
+    """The outlet drains A, which drains B. Vertices are indexed out, A, B."""
+
+    NODES = [(0.0, 0.0), (1000.0, 0.0), (1000.0, 1000.0)]
+
+    # Downstream and upstream incidence matrices, reach 0 joins A to out, reach 1 joins B to A.
+    DS = [[-1, -1], [0, -1], [-1, 1]]
+    US = [[1, -1], [-1, 2], [-1, -1]]
+
+    def _connect(self, offset, scale=1.0, reverse=False):
+        out, a, b = [(x * scale, y * scale) for x, y in self.NODES]
+        shift = lambda p: (p[0] + offset * scale, p[1] - offset * scale)
+        ends = [(shift(a), shift(out)), (shift(b), shift(a))]
+        if reverse:
+            ends = [(e, s) for s, e in ends]
+        catchment = pyromb.Catchment([Confluence("out", *out, True)],
+                                     [Basin("A", *a, 1.0, 0.0), Basin("B", *b, 1.0, 0.0)],
+                                     [Reach(f"R{k}", list(e)) for k, e in enumerate(ends)])
+        with mock.patch.object(catchment, "_nearestVertices", wraps=catchment._nearestVertices) as nearest:
+            ds, us = catchment.connect()
+        return ds.tolist(), us.tolist(), nearest.called
+
+    def assertConnected(self, ds, us):
+        self.assertEqual(ds, self.DS)
+        self.assertEqual(us, self.US)
+
+    def test_grid_snapping(self):
+        for reverse in (False, True):
+            with self.subTest(reverse=reverse):
+                ds, us, searched = self._connect(0.5, reverse=reverse)
+                self.assertConnected(ds, us)
+                self.assertFalse(searched)
+
+    def test_nearest_fallback(self):
+        ds, us, searched = self._connect(150.0)
+        self.assertConnected(ds, us)
+        self.assertTrue(searched)
+
+    def test_geographic_units(self):
+        ds, us, searched = self._connect(0.5, scale=1e-5)
+        self.assertConnected(ds, us)
+        self.assertFalse(searched)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from pyromb.math import geometry
+from pyromb.core.geometry.line import Line
+from pyromb.core.geometry.point import Point
+
+class TestLineLength(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(0)
+        self.lines = [[(rnd.uniform(4e5, 5e5), rnd.uniform(5e6, 6e6)) for _ in range(rnd.randint(2, 400))]
+                      for _ in range(200)]
+
+    def test_append(self):
+        for points in self.lines:
+            line = Line(points[:1])
+            for p in points[1:]:
+                line.append(Point(*p))
+            self.assertEqual(line.length(), Line(points).length())
+
+    def test_setitem(self):
+        for points in self.lines:
+            line = Line(points)
+            line[-1] = Point(*points[0])
+            self.assertEqual(line.length(), Line(points[:-1] + points[:1]).length())
+
+    def test_set_slice(self):
+        for points in self.lines:
+            line = Line(points)
+            line[1:] = points[:0:-1]
+            self.assertEqual(line.length(), Line(points[:1] + points[:0:-1]).length())
+            self.assertEqual(line.getEnd().coordinates(), points[1])
+
+class TestNearest(unittest.TestCase):
+    """Targets on a coarse grid with duplicates, so many points are equally close to several."""
+
+    def setUp(self):
+        rnd = np.random.default_rng(1)
+        self.targets = np.round(rnd.uniform(0, 20, (300, 2)))
+        self.targets[rnd.integers(0, 300, 100)] = self.targets[0]
+        self.points = np.round(rnd.uniform(0, 20, (2000, 2)) * 2) / 2
+        d = ((self.targets[:, None, :] - self.points[None, :, :]) ** 2).sum(axis=-1)
+        self.idx = d.argmin(axis=0)
+        self.sqdist = d[self.idx, np.arange(len(self.points))]
+
+    def assertNearest(self):
+        idx, sqdist = geometry.nearest(self.targets, self.points)
+        np.testing.assert_array_equal(idx, self.idx)
+        np.testing.assert_array_equal(sqdist, self.sqdist)
+
+    def test_scan(self):
+        with mock.patch.object(geometry, "_kdTree", return_value=False):
+            self.assertNearest()
+
+    def test_blocks(self):
+        with mock.patch.object(geometry, "_kdTree", return_value=False), \
+             mock.patch.object(geometry, "_NEAREST_BLOCK", 1000):
+            self.assertNearest()
+
+    @unittest.skipIf(not geometry._kdTree(), "SciPy is not installed")
+    def test_kd_tree(self):
+        with mock.patch.object(geometry, "_NEAREST_BLOCK", 0):
+            self.assertNearest()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pyromb
+from pyromb.core.attributes.basin import Basin
+from pyromb.core.attributes.confluence import Confluence
+from pyromb.core.attributes.reach import Reach, ReachType
+
+class TestControlVector(unittest.TestCase):
+
+    def _vector(self, reachType, slope):
+        confluences = [Confluence("out", 0.0, 0.0, True)]
+        basins = [Basin("A", 600.0, 800.0, 0.5, 0.1)]
+        reaches = [Reach("R1", [(600.0, 800.0), (0.0, 0.0)], reachType, slope)]
+        catchment = pyromb.Catchment(confluences, basins, reaches)
+        catchment.connect()
+        return pyromb.Traveller(catchment).getVector(pyromb.RORB())
+
+    def test_sloped_reach(self):
+        for reachType in (ReachType.UNLINED, ReachType.LINED):
+            with self.subTest(reachType=reachType):
+                vector = self._vector(reachType, 0.015)
+                self.assertIn(f"1,{reachType.value},1.000,0.015,-99", vector)
+
+    def test_slopeless_reach(self):
+        for reachType in (ReachType.NATURAL, ReachType.DROWNED):
+            with self.subTest(reachType=reachType):
+                vector = self._vector(reachType, 0.015)
+                self.assertIn(f"1,{reachType.value},1.000,-99", vector)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import numpy as np
+
+import pyromb
+from pyromb.model.wbnm import _BASIN, _CONFLUENCE, _OUTLET, _roundColumn
+from pyromb.core.attributes.basin import Basin
+from pyromb.core.attributes.confluence import Confluence
+from pyromb.core.attributes.reach import Reach
+
+try:
+    import shapefile
+except ImportError:
+    shapefile = None
+
+def _chain(basins):
+    """A catchment draining each basin into the one before it, the first into the outlet."""
+
+    confluences = [Confluence("out", 0, 0, True)]
+    reaches = []
+    previous = confluences[0]
+    for k, b in enumerate(basins):
+        reaches.append(Reach(f"R{k}", [b.coordinates(), previous.coordinates()]))
+        previous = b
+    catchment = pyromb.Catchment(confluences, basins, reaches)
+    catchment.connect()
+    return catchment
+
+def _render(catchment):
+    model = pyromb.WBNM()
+    return model, pyromb.Traveller(catchment).getVector(model)
+
+def _scalarRows(model):
+    """The topology and surface rows as the subarea by subarea value blocks write them."""
+
+    vb = model._createValueBlock
+    topology = ""
+    surface = ""
+    for s in model._subAreas:
+        x, y = s.coordinates()
+        ox, oy = s.out.coordinates()
+        topology += vb(s.name) + vb(round(x, 3)) + vb(round(y, 3)) + \
+            vb(round(ox, 3)) + vb(round(oy, 3)) + " " + vb(s.dsSubArea.name) + "\n"
+        surface += f"{vb(s.name)}{vb(round(s.area * 100, 2))}{vb(round(s.fi, 2))}\n"
+    return topology, surface
+
+class TestValueColumn(unittest.TestCase):
+
+    VALUES = [0, 600, -800, 0.5, -0.5, 2.675, 1.005, 444325.4615, -12.0005, 5300000.0005, 0.125, 1e-05, np.float64(2.675), np.float64(-7.0005)]
+
+    def assertColumn(self, values, ndigits=None):
+        model = pyromb.WBNM()
+        column = np.array(values, dtype=object)
+        if ndigits is not None:
+            column = _roundColumn(column, ndigits)
+            values = [round(v, ndigits) for v in values]
+        expected = [model._createValueBlock(v) for v in values]
+        self.assertEqual(model._createValueColumn(column).tolist(), expected)
+
+    def test_numbers(self):
+        self.assertColumn(self.VALUES)
+
+    def test_rounded_numbers(self):
+        for ndigits in (2, 3):
+            with self.subTest(ndigits=ndigits):
+                self.assertColumn(self.VALUES, ndigits)
+
+    def test_names(self):
+        self.assertColumn(["A", "SINK", 101, 102.5, "12"])
+
+    def test_empty(self):
+        self.assertEqual(pyromb.WBNM()._createValueColumn(np.empty(0, dtype=object)).tolist(), [])
+
+    def test_too_long(self):
+        with self.assertRaises(ValueError):
+            pyromb.WBNM()._createValueColumn(np.array(["ABCDEFGHIJKLM"], dtype=object))
+
+class TestSubAreaBlocks(unittest.TestCase):
+
+    def assertScalarRows(self, catchment):
+        model, vector = _render(catchment)
+        topology, surface = _scalarRows(model)
+        self.assertIn(topology, vector)
+        self.assertIn(surface, vector)
+        return vector
+
+    def test_int_values(self):
+        vector = self.assertScalarRows(_chain([Basin("A", 600, 800, 1, 0), Basin("B", 1200, 1600, 2, 1)]))
+        self.assertIn(f"{'A':<12}{600:>12}{800:>12}", vector)
+        self.assertIn(f"{'A':<12}{100:>12}{0:>12}", vector)
+
+    def test_float_values(self):
+        self.assertScalarRows(_chain([Basin("A", 600.25, 800.125, 0.73, 0.125), Basin("B", -1200.5, -1600.75, 0.2, 0.5)]))
+
+    def test_half_way_rounding(self):
+        vector = self.assertScalarRows(_chain([Basin("A", 444325.4615, 5300000.0005, 0.000125, 0.005),
+                                               Basin("B", -12.0005, 7.1235, 0.3335, 0.115)]))
+        self.assertIn(f"{round(444325.4615, 3):>12}", vector)
+
+    def test_numeric_names(self):
+        vector = self.assertScalarRows(_chain([Basin(101, 600.5, 800.5, 0.5, 0.1), Basin(102, 1200.5, 1600.5, 0.5, 0.1)]))
+        self.assertIn(f"{101:>12}{600.5:>12}", vector)
+
+class TestDownstreamIndex(unittest.TestCase):
+
+    class Traveller:
+        _endSentinel = -1
+
+        def __init__(self, links):
+            self.down = links.__getitem__
+
+    def test_passes_confluences(self):
+        model = pyromb.WBNM()
+        model._nodeKinds = [_OUTLET, _CONFLUENCE, _CONFLUENCE, _BASIN, _BASIN]
+        traveller = self.Traveller([0, 0, 1, 2, 3])
+        self.assertEqual(model._getDsIndex(traveller, 4), 3)
+        self.assertEqual(model._getDsIndex(traveller, 3), -1)
+
+    def test_cycle(self):
+        model = pyromb.WBNM()
+        model._nodeKinds = [_OUTLET, _CONFLUENCE, _CONFLUENCE, _BASIN]
+        with self.assertRaises(ValueError):
+            model._getDsIndex(self.Traveller([0, 2, 1, 2]), 3)
+
+@unittest.skipIf(shapefile is None, "pyshp is not installed")
+class TestSampleRunfile(unittest.TestCase):
+
+    def test_runfile(self):
+
+        class Layer(shapefile.Reader, pyromb.VectorLayer):
+
+            def geometry(self, i):
+                return self.shape(i).points
+
+            def record(self, i):
+                return super().record(i)
+
+            def __len__(self):
+                return super().__len__()
+
+        data = os.path.join(ROOT, "data")
+        builder = pyromb.Builder()
+        reaches = builder.reach(Layer(os.path.join(data, "reaches.shp")))
+        confluences = builder.confluence(Layer(os.path.join(data, "confluences.shp")))
+        basins = builder.basin(Layer(os.path.join(data, "centroids.shp")), Layer(os.path.join(data, "basins.shp")))
+        catchment = pyromb.Catchment(confluences, basins, reaches)
+        catchment.connect()
+        with open(os.path.join(ROOT, "runfile.wbn"), "r") as f:
+            expected = f.read()
+        self.assertEqual(pyromb.Traveller(catchment).getVector(pyromb.WBNM()), expected)
+
+if __name__ == "__main__":
+    unittest.main()